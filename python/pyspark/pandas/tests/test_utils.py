@@ -38,19 +38,21 @@ some_global_variable = 0
 
 
 class UtilsTestsMixin:
+    # shared read-only pandas DataFrame used by the dummy functions and assertion tests below
+    _pdf_abc = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 3])
 
     # a dummy to_html version with an extra parameter that pandas does not support
     # used in test_validate_arguments_and_invoke_function
     def to_html(self, max_rows=None, unsupported_param=None):
-        args = locals()
+        args = {"self": self, "max_rows": max_rows, "unsupported_param": unsupported_param}
 
-        pdf = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 3])
+        pdf = self._pdf_abc
         validate_arguments_and_invoke_function(pdf, self.to_html, pd.DataFrame.to_html, args)
 
     def to_clipboard(self, sep=",", **kwargs):
-        args = locals()
+        args = {"self": self, "sep": sep, "kwargs": kwargs}
 
-        pdf = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 3])
+        pdf = self._pdf_abc
         validate_arguments_and_invoke_function(
             pdf, self.to_clipboard, pd.DataFrame.to_clipboard, args
         )
@@ -180,8 +182,10 @@ class UtilsTestsMixin:
         assertPandasOnSparkEqual(psdf1, psdf2)
 
     def test_dataframe_error_assert_pandas_equal(self):
-        pdf1 = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 3])
+        pdf1 = self._pdf_abc
         pdf2 = pd.DataFrame({"a": [1, 3, 3], "b": [4, 5, 6]}, index=[0, 1, 3])
+        left_str, left_dtype = pdf1.to_string(), str(pdf1.dtypes)
+        right_str, right_dtype = pdf2.to_string(), str(pdf2.dtypes)
 
         with self.assertRaises(PySparkAssertionError) as pe:
             _assert_pandas_equal(pdf1, pdf2, True)
@@ -190,16 +194,18 @@ class UtilsTestsMixin:
             exception=pe.exception,
             error_class="DIFFERENT_PANDAS_DATAFRAME",
             message_parameters={
-                "left": pdf1.to_string(),
-                "left_dtype": str(pdf1.dtypes),
-                "right": pdf2.to_string(),
-                "right_dtype": str(pdf2.dtypes),
+                "left": left_str,
+                "left_dtype": left_dtype,
+                "right": right_str,
+                "right_dtype": right_dtype,
             },
         )
 
     def test_series_error_assert_pandas_equal(self):
         series1 = pd.Series([1, 2, 3])
         series2 = pd.Series([4, 5, 6])
+        left_str, left_dtype = series1.to_string(), str(series1.dtype)
+        right_str, right_dtype = series2.to_string(), str(series2.dtype)
 
         with self.assertRaises(PySparkAssertionError) as pe:
             _assert_pandas_equal(series1, series2, True)
@@ -208,16 +214,17 @@ class UtilsTestsMixin:
             exception=pe.exception,
             error_class="DIFFERENT_PANDAS_SERIES",
             message_parameters={
-                "left": series1.to_string(),
-                "left_dtype": str(series1.dtype),
-                "right": series2.to_string(),
-                "right_dtype": str(series2.dtype),
+                "left": left_str,
+                "left_dtype": left_dtype,
+                "right": right_str,
+                "right_dtype": right_dtype,
             },
         )
 
     def test_index_error_assert_pandas_equal(self):
         index1 = pd.Index([1, 2, 3])
         index2 = pd.Index([4, 5, 6])
+        left_dtype, right_dtype = str(index1.dtype), str(index2.dtype)
 
         with self.assertRaises(PySparkAssertionError) as pe:
             _assert_pandas_equal(index1, index2, True)
@@ -227,9 +234,9 @@ class UtilsTestsMixin:
             error_class="DIFFERENT_PANDAS_INDEX",
             message_parameters={
                 "left": index1,
-                "left_dtype": str(index1.dtype),
+                "left_dtype": left_dtype,
                 "right": index2,
-                "right_dtype": str(index2.dtype),
+                "right_dtype": right_dtype,
             },
         )
 
@@ -238,6 +245,7 @@ class UtilsTestsMixin:
         pdf2 = pd.DataFrame({"a": [1, 5, 3], "b": [1, 5, 6]}, index=[0, 1, 3])
         multiindex1 = pd.MultiIndex.from_frame(pdf1)
         multiindex2 = pd.MultiIndex.from_frame(pdf2)
+        left_dtype, right_dtype = str(multiindex1.dtype), str(multiindex2.dtype)
 
         with self.assertRaises(PySparkAssertionError) as pe:
             _assert_pandas_almost_equal(multiindex1, multiindex2)
@@ -247,9 +255,9 @@ class UtilsTestsMixin:
             error_class="DIFFERENT_PANDAS_MULTIINDEX",
             message_parameters={
                 "left": multiindex1,
-                "left_dtype": str(multiindex1.dtype),
+                "left_dtype": left_dtype,
                 "right": multiindex2,
-                "right_dtype": str(multiindex1.dtype),
+                "right_dtype": right_dtype,
             },
         )
 